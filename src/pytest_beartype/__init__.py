@@ -1,9 +1,74 @@
-"""pytest-beartype - Pytest plugin to run your tests with beartype checking enabled."""
+"""
+pytest-beartype - Pytest plugin to run your tests with beartype checking enabled.
+
+PYTEST_DONT_REWRITE
+"""
 
 from __future__ import annotations
 
 import pytest
 
+# Frozen set of the top-level names of all packages ignorable by the warning
+# about previously imported packages whenever "--beartype-packages=*" is passed,
+# built on the first call to _get_package_names_ignorable(). Plain "pytest" runs
+# that never pass "--beartype-packages" thus never build this set.
+_package_names_ignorable: frozenset[str] | None = None
+
+
+def _get_package_names_ignorable() -> frozenset[str]:
+    # Build this set at most once per interpreter. The standard library (and
+    # builtin) module names are static for the lifetime of the interpreter, so
+    # there is no need to re-unify them on every "pytest_configure" call.
+    global _package_names_ignorable
+    if _package_names_ignorable is None:
+        import sys
+
+        # Unify the names of all builtin and standard modules with the names of
+        # all packages imported by "pytest" and this plugin before the
+        # pytest_configure() hook runs, as the user has no control over those.
+        _package_names_ignorable = (
+            frozenset(
+                (
+                    "__main__",
+                    "beartype",
+                    "_pytest",
+                    "iniconfig",
+                    "pluggy",
+                    "py",
+                    "pytest",
+                    "pytest_beartype",
+                )
+            )
+            | frozenset(sys.builtin_module_names)
+            | frozenset(getattr(sys, "stdlib_module_names", ()))
+        )
+    return _package_names_ignorable
+
+
+# Beartype-specific "pytest" warning subclass, defined on the first call to
+# _get_beartype_pytest_warning(). This class is defined lazily to avoid importing
+# beartype unless the user actually passed the "--beartype-packages" option, but
+# only once so that repeated "pytest_configure" calls share the same class.
+_beartype_pytest_warning: type[Warning] | None = None
+
+
+def _get_beartype_pytest_warning() -> type[Warning]:
+    global _beartype_pytest_warning
+    if _beartype_pytest_warning is None:
+        from beartype.roar import BeartypeWarning
+
+        class BeartypePytestWarning(BeartypeWarning):
+            """
+            Beartype :mod:`pytest` warning.
+
+            This warning is emitted at :mod:`pytest` configuration time when one or
+            more packages or modules to be type-checked have already been imported
+            under the active Python interpreter.
+            """
+
+        _beartype_pytest_warning = BeartypePytestWarning
+    return _beartype_pytest_warning
+
 
 def pytest_addoption(parser: "pytest.Parser") -> None:
     # Add beartype-specific "pytest" options exposed by this plugin.
@@ -23,114 +88,116 @@ def pytest_addoption(parser: "pytest.Parser") -> None:
     parser.addini("beartype_skip_packages", type="args", help=skip_help_msg)
 
 
+def _get_pytest_option_tuple(
+    config: "pytest.Config", option_name: str
+) -> tuple[str, ...]:
+    # Merge the list of names in the "pytest.ini" section with the same name as
+    # this option with the comma-delimited string passed to the corresponding
+    # "--" command-line option, if any. Note that a new immutable tuple is
+    # returned rather than the list returned by getini(), which "pytest" caches
+    # and which callers must thus *NEVER* mutate.
+    option_tuple = tuple(config.getini(option_name))
+    option_list_str: str | None = config.getoption(option_name, "")
+    if not option_list_str:
+        return option_tuple
+
+    # Split this string in a single pass on commas and any whitespace around
+    # them, after stripping enclosing quotes and whitespace (e.g., left by tox
+    # or an overly cautious shell), ignoring empty names (e.g., from a trailing
+    # comma).
+    import re
+
+    return option_tuple + tuple(
+        name for name in re.split(r"\s*,\s*", option_list_str.strip("\"' \t")) if name
+    )
+
+
+def _join_quoted_names(names: list[str]) -> str:
+    # Human-readable comma-delimited double-quoted string listing these names
+    # (e.g., '"a"', '"a" and "b"', '"a", "b", and "c"'). This is formatted here
+    # rather than with beartype's private join_delimited() utility, which drags
+    # in a private beartype subpackage only to emit a warning.
+    names_quoted = [f'"{name}"' for name in names]
+    if len(names_quoted) <= 2:
+        return " and ".join(names_quoted)
+    return ", ".join(names_quoted[:-1]) + ", and " + names_quoted[-1]
+
+
 def pytest_configure(config: "pytest.Config") -> None:
-    # Comma-delimited string listing the fully-qualified names of *ALL* packages
-    # and modules to type-check with beartype, corresponding to the
-    # "beartype_packages" section in the user-defined "pytest.ini" file, or the
-    # "--beartype-packages" options, defined above by the pytest_addoption() hook.
-    package_names = config.getini("beartype_packages")
-    package_names_arg_str = config.getoption("beartype_packages", "")
-    if package_names_arg_str:
-        package_names += package_names_arg_str.split(",")
-
-    packages_to_skip = config.getini("beartype_skip_packages")
-    packages_to_skip_arg_str = config.getoption("beartype_skip_packages", "")
-    if packages_to_skip_arg_str:
-        packages_to_skip += packages_to_skip_arg_str.split(",")
+    # Tuple of the fully-qualified names of *ALL* packages and modules to
+    # type-check with beartype, corresponding to the "beartype_packages" section
+    # in the user-defined "pytest.ini" file, or the "--beartype-packages" option,
+    # defined above by the pytest_addoption() hook.
+    package_names = _get_pytest_option_tuple(config, "beartype_packages")
+
+    # If the user did not pass this option, silently reduce to a noop. Avoid
+    # even parsing the "--beartype-skip-packages" option, which is meaningless
+    # without the former.
+    if not package_names:
+        return
+
+    # Frozen set of these names, enabling constant-time membership tests and
+    # set operations below regardless of how many names the user passed.
+    package_names_set = frozenset(package_names)
+
+    # True only if the user requested that *ALL* packages be type-checked.
+    is_package_names_all = "*" in package_names_set
+
+    packages_to_skip = _get_pytest_option_tuple(config, "beartype_skip_packages")
 
     # If `--beartype-packages` is specified (and isn't just `*`),
     # and `--beartype-skip-packages` is also specified, then bail out with an error.
-    if package_names and "*" not in package_names and packages_to_skip:
+    if not is_package_names_all and packages_to_skip:
         pytest.exit(
             "'beartype_packages' and 'beartype_skip_packages' cannot be used together."
         )
 
-    # If the user passed this option...
-    if package_names:
-        # Defer hook-specific imports. To improve "pytest" startup performance,
-        # avoid performing *ANY* imports unless the user actually passed the
-        # "--beartype-packages" option declared by this plugin.
-        import sys
+    # Defer hook-specific imports. To improve "pytest" startup performance,
+    # avoid performing *ANY* imports unless the user actually passed the
+    # "--beartype-packages" option declared by this plugin.
+    import sys
+
+    from beartype.claw import beartype_all, beartype_packages
+
+    # Set of the subset of these names corresponding to previously imported
+    # packages and modules under the active Python interpreter, computed via
+    # C-level set operations rather than per-name filtering. This set is only
+    # sorted below if a warning is actually emitted.
+    if is_package_names_all:
+        package_imported_names = {
+            module.partition(".")[0] for module in sys.modules
+        } - _get_package_names_ignorable()
+    else:
+        package_imported_names = sys.modules.keys() & package_names_set
+
+    # If at least one of these packages or modules has already been
+    # imported...
+    if package_imported_names:
+        # Comma-delimited double-quoted string listing these packages. Yeah!
+        package_imported_names_str = _join_quoted_names(sorted(package_imported_names))
+
+        # Emit a non-fatal warning informing the user.
         from warnings import warn
 
-        from beartype import BeartypeConf
-        from beartype._util.text.utiltextjoin import join_delimited
-        from beartype.claw import beartype_all, beartype_packages
-        from beartype.roar import BeartypeWarning
-
-        class BeartypePytestWarning(BeartypeWarning):
-            """
-            Beartype :mod:`pytest` warning.
-
-            This warning is emitted at :mod:`pytest` configuration time when one or
-            more packages or modules to be type-checked have already been imported
-            under the active Python interpreter.
-            """
-
-        # This (and `sys.builtin_module_names`) will be used to filter out
-        # already-imported modules from the warning message (about the fact that
-        # some modules have already been imported and will not be checked), whenever
-        # `--beartype-packages=*` or `--beartype-skip-packages` flags are used.
-        stdlib_module_names = getattr(sys, "stdlib_module_names", [])
-
-        # Tuple of the subset of these names corresponding to previously
-        # imported packages and modules under the active Python interpreter.
-        if "*" in package_names:
-            imported_packages = sorted(
-                {module.partition(".")[0] for module in sys.modules}
-            )
-            beartype_imported_packages = (
-                "__main__",
-                "beartype",
-                "_pytest",
-                "iniconfig",
-                "pluggy",
-                "py",
-                "pytest",
-                "pytest_beartype",
-            )
-            package_imported_names = tuple(
-                package
-                for package in imported_packages
-                if (
-                    package not in beartype_imported_packages
-                    and package not in sys.builtin_module_names
-                    and package not in stdlib_module_names
-                )
-            )
-        else:
-            package_imported_names = tuple(
-                package_name
-                for package_name in package_names
-                if package_name in sys.modules
-            )
+        warn(
+            (
+                f"Previously imported packages "
+                f"{package_imported_names_str} not checkable by beartype."
+            ),
+            _get_beartype_pytest_warning(),
+            stacklevel=1,  # <-- dark magic glistens dangerously
+        )
 
-        # If at least one of these packages or modules has already been
-        # imported...
-        if package_imported_names:
-            # Comma-delimited double-quoted string listing these packages. Yeah!
-            package_imported_names_str = join_delimited(
-                strs=package_imported_names,
-                delimiter_if_two=" and ",
-                delimiter_if_three_or_more_nonlast=", ",
-                delimiter_if_three_or_more_last=", and ",
-                is_double_quoted=True,
-            )
+    # Install an import hook type-checking these packages and modules.
+    if is_package_names_all:
+        # If the user also passed packages to skip, configure beartype to skip
+        # them. Else, defer to beartype's default configuration rather than
+        # constructing an equivalent configuration with no skipped packages.
+        if packages_to_skip:
+            from beartype import BeartypeConf
 
-            # Emit a non-fatal warning informing the user.
-            warn(
-                (
-                    f"Previously imported packages "
-                    f"{package_imported_names_str} not checkable by beartype."
-                ),
-                BeartypePytestWarning,
-                stacklevel=1,  # <-- dark magic glistens dangerously
-            )
-
-        # Install an import hook type-checking these packages and modules.
-        if "*" in package_names:
-            beartype_all(
-                conf=BeartypeConf(claw_skip_package_names=tuple(packages_to_skip))
-            )
+            beartype_all(conf=BeartypeConf(claw_skip_package_names=packages_to_skip))
         else:
-            beartype_packages(package_names)
+            beartype_all()
+    else:
+        beartype_packages(package_names)
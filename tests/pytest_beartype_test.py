@@ -1,9 +1,24 @@
+from __future__ import annotations
+
 from unittest import mock
 
 import pytest
 import pytest_beartype
 
 
+def _make_config(packages: str, skip_packages: str = "") -> mock.Mock:
+    """
+    Mock "pytest" configuration passing these comma-delimited strings as the
+    "--beartype-packages" and "--beartype-skip-packages" options, respectively,
+    with no corresponding "pytest.ini" sections.
+    """
+    options = {"beartype_packages": packages, "beartype_skip_packages": skip_packages}
+    config = mock.Mock()
+    config.getini.return_value = []
+    config.getoption.side_effect = lambda name, default: options[name]
+    return config
+
+
 def test_pytest_addoption() -> None:
     """
     Assert that the "pytest_addoption" hook declared by this plugin adds the
@@ -27,3 +42,126 @@ def test_pytest_addoption() -> None:
             ),
         ]
     )
+
+
+def test_get_package_names_ignorable() -> None:
+    """
+    Assert that the set of package names ignorable by the "--beartype-packages=*"
+    warning covers builtin modules and this plugin, and is only built once.
+    """
+    package_names_ignorable = pytest_beartype._get_package_names_ignorable()
+
+    assert "sys" in package_names_ignorable
+    assert "pytest_beartype" in package_names_ignorable
+    assert pytest_beartype._get_package_names_ignorable() is package_names_ignorable
+
+
+def test_get_pytest_option_tuple() -> None:
+    """
+    Assert that the "_get_pytest_option_tuple" helper merges the ini list with the
+    comma-delimited command-line option, ignoring enclosing quotes, whitespace, and
+    empty names, without mutating the ini list itself.
+    """
+    ini_list = ["foo"]
+    config = mock.Mock()
+    config.getini.return_value = ini_list
+    config.getoption.return_value = "'bar , baz,'"
+
+    assert pytest_beartype._get_pytest_option_tuple(config, "beartype_packages") == (
+        "foo",
+        "bar",
+        "baz",
+    )
+    assert ini_list == ["foo"]
+
+
+@pytest.mark.parametrize(
+    ("names", "expected"),
+    [
+        (["a"], '"a"'),
+        (["a", "b"], '"a" and "b"'),
+        (["a", "b", "c"], '"a", "b", and "c"'),
+    ],
+)
+def test_join_quoted_names(names: list[str], expected: str) -> None:
+    """
+    Assert that the "_join_quoted_names" helper lists names in human-readable
+    form for the "previously imported packages" warning.
+    """
+    assert pytest_beartype._join_quoted_names(names) == expected
+
+
+def test_pytest_configure_warns_previously_imported() -> None:
+    """
+    Assert that the "pytest_configure" hook declared by this plugin warns about
+    packages passed to "--beartype-packages" that were already imported.
+    """
+    from beartype.roar import BeartypeWarning
+
+    config = _make_config("pytest_beartype,not_a_real_package")
+
+    with mock.patch("beartype.claw.beartype_packages") as mock_beartype_packages:
+        with pytest.warns(BeartypeWarning, match='"pytest_beartype" not checkable'):
+            pytest_beartype.pytest_configure(config)
+
+    mock_beartype_packages.assert_called_once_with(
+        ("pytest_beartype", "not_a_real_package")
+    )
+
+
+def test_get_beartype_pytest_warning() -> None:
+    """
+    Assert that the beartype-specific "pytest" warning class is a beartype warning
+    defined only once, rather than once per "pytest_configure" call.
+    """
+    from beartype.roar import BeartypeWarning
+
+    warning_cls = pytest_beartype._get_beartype_pytest_warning()
+
+    assert issubclass(warning_cls, BeartypeWarning)
+    assert pytest_beartype._get_beartype_pytest_warning() is warning_cls
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_pytest_configure_skip_packages() -> None:
+    """
+    Assert that the "pytest_configure" hook declared by this plugin passes the
+    "--beartype-skip-packages" option as a tuple to beartype when type-checking
+    all packages.
+    """
+    config = _make_config("*", "foo,bar")
+
+    with mock.patch("beartype.claw.beartype_all") as mock_beartype_all:
+        pytest_beartype.pytest_configure(config)
+
+    conf = mock_beartype_all.call_args.kwargs["conf"]
+    assert conf.claw_skip_package_names == ("foo", "bar")
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_pytest_configure_all_packages() -> None:
+    """
+    Assert that the "pytest_configure" hook declared by this plugin defers to
+    beartype's default configuration when type-checking all packages without
+    skipping any.
+    """
+    config = _make_config("*")
+
+    with mock.patch("beartype.claw.beartype_all") as mock_beartype_all:
+        pytest_beartype.pytest_configure(config)
+
+    mock_beartype_all.assert_called_once_with()
+
+
+def test_pytest_configure_packages_and_skip_packages() -> None:
+    """
+    Assert that the "pytest_configure" hook declared by this plugin exits when
+    explicit "--beartype-packages" are combined with "--beartype-skip-packages".
+    """
+    config = _make_config("foo", "bar")
+
+    with mock.patch("beartype.claw.beartype_packages") as mock_beartype_packages:
+        with pytest.raises(pytest.exit.Exception, match="cannot be used together"):
+            pytest_beartype.pytest_configure(config)
+
+    mock_beartype_packages.assert_not_called()